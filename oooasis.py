@@ -22,7 +22,6 @@ Dependencies:
       For interacting with the Google Calendar API.
     - rich: For enhanced console output.
     - dateutil: For timezone handling.
-    - configparser: For configuration file parsing.
 
 Note:
     Only "default" and "workingLocation" event types can be created using the API
@@ -34,22 +33,40 @@ Note:
 """
 
 import os.path
-import datetime as dt
 import argparse
 import sys
-import configparser
-from datetime import datetime, timedelta
-from dateutil import tz
-
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from rich.console import Console
+import functools
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
-console = Console()
+# The Calendar API accepts at most 50 calls in a single batch request.
+BATCH_LIMIT = 50
+# Worker threads used to run independent API requests concurrently.
+MAX_WORKERS = 8
+# Partial-response mask for events.list: only the event fields this script reads.
+EVENT_FIELDS = (
+    "nextPageToken,"
+    "items(id,summary,eventType,"
+    "start(date,dateTime,timeZone),end(date,dateTime,timeZone))"
+)
+# Largest events.list page requested when no smaller limit applies.
+MAX_PAGE_SIZE = 250
+# Where incremental sync keeps its local copy of each team calendar.
+SYNC_DIR = os.path.join(os.path.expanduser("~"), ".oooasis")
+# Partial-response mask for incremental sync; status marks deleted events.
+SYNC_EVENT_FIELDS = (
+    "nextPageToken,nextSyncToken,"
+    "items(id,status,summary,eventType,recurrence,recurringEventId,"
+    "start(date,dateTime,timeZone),end(date,dateTime,timeZone))"
+)
+# Calendar service built by GoogleCalendarAuth.authenticate, shared by every manager.
+_SERVICE = None
+# Credentials the service was built with, reused by the worker thread transports.
+_CREDENTIALS = None
 
 # NOTE: Currently, only "default " and "workingLocation" events can be created using the API.
 # Extended support for other event types will be made available in later releases.
@@ -57,6 +74,154 @@ console = Console()
 # https://issuetracker.google.com/issues/112063903
 
 
+@functools.lru_cache(maxsize=None)
+def _console():
+    """
+    Return the shared rich Console, importing rich on first use.
+
+    rich pulls in a sizeable set of modules; deferring it keeps '--help' and
+    argument errors from paying that import time.
+
+    Returns:
+        rich.console.Console: The console used for all output.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def _authorized_http(creds):
+    """
+    Create an authorized HTTP transport for the Calendar API.
+
+    Each transport keeps its connection to the API host alive between requests.
+    httplib2 transports are not thread-safe, so each thread needs its own. The
+    underlying transport is googleapiclient's default one (build_http), with its
+    timeout and redirect handling.
+
+    Parameters:
+        creds (google.oauth2.credentials.Credentials): The user credentials.
+
+    Returns:
+        google_auth_httplib2.AuthorizedHttp: The authorized transport.
+    """
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.http import build_http
+
+    return AuthorizedHttp(creds, http=build_http())
+
+
+def _sync_state_path(calendar_id):
+    """Return the path of the incremental sync state file for a calendar."""
+    digest = hashlib.sha1(calendar_id.encode("utf-8")).hexdigest()
+    return os.path.join(SYNC_DIR, f"{digest}.json")
+
+
+def _load_sync_state(path):
+    """
+    Load an incremental sync state file.
+
+    Parameters:
+        path (str): The path returned by _sync_state_path.
+
+    Returns:
+        dict: The state, with 'sync_token' (str or None) and 'events' (dict of
+            event objects keyed by ID). A missing, unreadable or incomplete file
+            yields an empty state, which triggers a full sync.
+    """
+    try:
+        with open(path, encoding="utf-8") as state_file:
+            state = json.load(state_file)
+        if isinstance(state.get("events"), dict) and "sync_token" in state:
+            return state
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"sync_token": None, "events": {}}
+
+
+def _save_sync_state(path, state):
+    """
+    Write an incremental sync state file, replacing the previous one atomically.
+
+    The file is a copy of the team calendar, so it is only readable by the user.
+    """
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as state_file:
+        json.dump(state, state_file)
+    os.replace(tmp_path, path)
+
+
+def _ooo_event_id(event_summary, start_date, end_date):
+    """
+    Derive a deterministic Calendar event ID for an OOO event.
+
+    Event IDs must use base32hex characters (a-v, 0-9); a hex digest is a subset.
+
+    Parameters:
+        event_summary (str): The summary of the OOO event.
+        start_date (str): The start date in 'YYYY-MM-DD' format.
+        end_date (str): The exclusive end date in 'YYYY-MM-DD' format.
+
+    Returns:
+        str: A 26-character event ID.
+    """
+    key = f"{event_summary}|{start_date}|{end_date}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:26]
+
+
+def _looks_like_calendar_id(name):
+    """Return True if a calendar name is already in calendar ID (email) form."""
+    return name == "primary" or "@" in name or name.endswith(".calendar.google.com")
+
+
+@functools.lru_cache(maxsize=64)
+def _gettz(name):
+    """
+    Return the tzinfo for a timezone name, or the local timezone for None.
+
+    tz.gettz reads zoneinfo data; OOO listings usually share one or two zones,
+    so the lookups are cached.
+    """
+    from dateutil import tz
+
+    return tz.gettz(name)
+
+
+def _local_day_bounds(day):
+    """
+    Return the RFC 3339 (timeMin, timeMax) strings spanning one local day.
+
+    Parameters:
+        day (datetime.date): The day, in the local timezone.
+
+    Returns:
+        tuple: Local midnight of the day and of the following day.
+    """
+    day_start = datetime.combine(day, datetime.min.time()).astimezone()
+    day_end = datetime.combine(day + timedelta(days=1), datetime.min.time()).astimezone()
+    return day_start.isoformat(), day_end.isoformat()
+
+
+def _upcoming_window():
+    """
+    Return the time window listed as upcoming: today until the end of next month.
+
+    Returns:
+        tuple: The (timeMin, timeMax) RFC 3339 strings, in UTC.
+    """
+    from dateutil.relativedelta import relativedelta
+
+    today = datetime.now(timezone.utc).date()
+    # day=31 is clamped to the last day of the month
+    last_day_next_month = today + relativedelta(months=1, day=31)
+    return (
+        today.isoformat() + "T00:00:00Z",
+        last_day_next_month.isoformat() + "T23:59:59Z",
+    )
+
+
 class GoogleCalendarAuth:
     """
     Handles authentication for Google Calendar.
@@ -73,9 +238,11 @@ class GoogleCalendarAuth:
         Authenticate the user and return a Google Calendar API service object.
 
         This method performs OAuth 2.0 authentication using credentials from a client
-        secrets file. It saves the credentials in a token file for reuse in future sessions.
+        secrets file. It saves the credentials in a token file for reuse in future sessions;
+        the file is only rewritten when the credentials were refreshed or newly obtained.
         If valid credentials are found in the token file, they are refreshed and used;
-        otherwise, new credentials are obtained via OAuth 2.0.
+        otherwise, new credentials are obtained via OAuth 2.0. The service is built
+        once per process; later calls return the same object.
 
         Returns:
             googleapiclient.discovery.Resource: A service object for the Google Calendar API.
@@ -84,12 +251,24 @@ class GoogleCalendarAuth:
             FileNotFoundError: If the client secrets file is not found.
             google.auth.exceptions.RefreshError: If the credentials refresh fails.
         """
+        global _SERVICE, _CREDENTIALS
+        if _SERVICE is not None:
+            return _SERVICE
+
+        # The Google client libraries are imported here rather than at module level
+        # so that '--help' and argument errors do not pay their import time.
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
 
         creds = None
+        changed = False
         if os.path.exists("token.json"):
             creds = Credentials.from_authorized_user_file("token.json", SCOPES)
 
         if not creds or not creds.valid:
+            changed = True
             if creds and creds.expired and creds.refresh_token:
                 creds.refresh(Request())
             else:
@@ -98,14 +277,28 @@ class GoogleCalendarAuth:
                         "client_secret.json", SCOPES
                     )
                 except FileNotFoundError:
-                    console.print("[bold red]Error:[/bold red] 'client_secret.json' not found.")
-                    console.print("Please add the 'client_secret.json' file and retry.", style="bold yellow")
+                    _console().print("[bold red]Error:[/bold red] 'client_secret.json' not found.")
+                    _console().print("Please add the 'client_secret.json' file and retry.", style="bold yellow")
                     sys.exit(1)  # Exit the script with an error code
                 creds = flow.run_local_server(port=0)
+
+        # Only persist the token when it was refreshed or newly obtained
+        if changed:
             with open("token.json", "w", encoding='utf-8') as token:
                 token.write(creds.to_json())
 
-        return build("calendar", "v3", credentials=creds)
+        # Load the Calendar v3 discovery document bundled with googleapiclient instead
+        # of fetching it from discovery.googleapis.com on every run. All requests
+        # made from the main thread share the one keep-alive transport.
+        _CREDENTIALS = creds
+        _SERVICE = build(
+            "calendar",
+            "v3",
+            http=_authorized_http(creds),
+            static_discovery=True,
+            cache_discovery=False,
+        )
+        return _SERVICE
 
 class GoogleCalendarManager:
     """
@@ -118,6 +311,27 @@ class GoogleCalendarManager:
     Attributes:
         service (googleapiclient.discovery.Resource): An authenticated service
             object for interacting with the Google Calendar API.
+        team_calendar_name (str): The 'default_team_calendar' configuration value.
+        timezone (str): The 'timezone' configuration value.
+        username (str): The local part of 'default_personal_calendar'.
+        ooo_pattern (str): The 'ooo_pattern' configuration value, stripped.
+        event_summary (str): The summary of the user's OOO events,
+            '<username> <ooo_pattern>'.
+        incremental_sync (bool): The 'incremental_sync' configuration value; when
+            set, upcoming events are read from a local copy kept up to date with
+            sync tokens (see _sync_events).
+        _calendar_ids (dict): Calendar IDs already resolved by
+            get_calendar_id_by_name, keyed by calendar name.
+        _guessed_calendar_ids (set): Names in _calendar_ids that were used as IDs
+            as-is, without asking the API.
+        _calendar_ids_by_summary (dict or None): The user's calendar list as a
+            {summary: id} dict, fetched on first need.
+        _executor (concurrent.futures.ThreadPoolExecutor): Worker pool used to
+            run independent API requests concurrently (see _submit).
+        _credentials (google.oauth2.credentials.Credentials): The credentials
+            the service was built with, used for the worker thread transports.
+        _thread_local (threading.local): Per worker thread state; holds the
+            thread's authorized HTTP transport once created.
     """
 
     def __init__(self):
@@ -126,18 +340,72 @@ class GoogleCalendarManager:
 
         The constructor authenticates with Google Calendar using GoogleCalendarAuth
         and initializes the service attribute, which will be used for subsequent
-        Google Calendar operations.
+        Google Calendar operations. It also reads the configuration values used by
+        every operation once, via get_default_config.
         """
         self.service = GoogleCalendarAuth.authenticate()
+        self.team_calendar_name = get_default_config("default_team_calendar")
+        self.timezone = get_default_config("timezone")
+        self.username = get_default_config("default_personal_calendar").split("@")[0]
+        self.ooo_pattern = get_default_config("ooo_pattern").strip()
+        self.event_summary = f"{self.username} {self.ooo_pattern}"
+        self.incremental_sync = (get_default_config("incremental_sync") or "").lower() in (
+            "1",
+            "yes",
+            "true",
+            "on",
+        )
+        self._calendar_ids = {}
+        self._guessed_calendar_ids = set()
+        self._calendar_ids_by_summary = None
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self._credentials = _CREDENTIALS
+        self._thread_local = threading.local()
+
+    def _submit(self, request):
+        """
+        Execute an API request on the worker pool.
+
+        The request object must be built by the caller; building it does no I/O.
+        httplib2 connections are not thread-safe, so each worker thread executes
+        requests over its own authorized HTTP transport instead of the one owned
+        by the service.
+
+        Parameters:
+            request (googleapiclient.http.HttpRequest): The request to execute.
+
+        Returns:
+            concurrent.futures.Future: A future resolving to the API response.
+        """
+        return self._executor.submit(self._execute_in_worker, request)
+
+    def _execute_in_worker(self, request):
+        """
+        Execute a request on the calling worker thread's own HTTP transport.
+
+        The transport is created on the thread's first request and reused after.
+
+        Parameters:
+            request (googleapiclient.http.HttpRequest): The request to execute.
+
+        Returns:
+            dict: The API response.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = _authorized_http(self._credentials)
+            self._thread_local.http = http
+        return request.execute(http=http)
 
     def enable_out_of_office(self, start_date, end_date):
         """
         Enable an "Out of Office" event on the team calendar for specified dates.
 
         This method creates an "Out of Office" event on the team calendar for the
-        specified date range. It first checks if an event for the given date range
-        already exists to avoid duplicates. If no such event exists, it creates a new
-        event with the specified summary and description.
+        specified date range. The event ID is derived from the event summary and the
+        date range, so inserting the same OOO twice is rejected by the API instead of
+        creating a duplicate; no separate existence check is needed. If the matching
+        event was deleted earlier, it is restored.
 
         Parameters:
             start_date (str): The start date of the "Out of Office" event in 'YYYY-MM-DD' format.
@@ -153,43 +421,35 @@ class GoogleCalendarManager:
             - The method adjusts the end date by adding one day to ensure the "Out of Office"
               status for the entire duration of the end date.
             - The method uses configurations like 'default_team_calendar', 'timezone',
-              'default_personal_calendar', and 'ooo_pattern' from a configuration method
-              (get_default_config).
+              'default_personal_calendar', and 'ooo_pattern' as read once
+              by __init__.
             - Warnings and errors are printed to the console if the event already exists or
               if an error occurs while creating the event.
         """
-        team_calendar_name = get_default_config("default_team_calendar")
-        timezone = get_default_config("timezone")
-        username = get_default_config("default_personal_calendar").split("@")[0]
-        ooo_pattern = get_default_config("ooo_pattern").strip()
-        event_summary = f"{username} {ooo_pattern}"
+        from googleapiclient.errors import HttpError
 
         # Get the calendar ID from the calendar name
-        team_calendar_id = self.get_calendar_id_by_name(team_calendar_name)
-
-        # Check if the event already exists
-        adjusted_end_date = (
-            datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
-        ).strftime("%Y-%m-%d")
-        if self.event_exists(
-            team_calendar_id, start_date, adjusted_end_date, event_summary
-        ):
-            console.print(
-                f"[yellow]Warning: OOO event for {start_date} to {end_date} already exists on the team calendar - {team_calendar_name}.  Skipping action.[/yellow]"
+        calendar_id = self.get_calendar_id_by_name(self.team_calendar_name)
+        if not calendar_id:
+            _console().print(
+                f"[red]Error:[/red] Calendar '{self.team_calendar_name}' not found."
             )
             return
 
+        adjusted_end_date = (date.fromisoformat(end_date) + timedelta(days=1)).isoformat()
+
         # Create the OOO event
         event = {
-            "summary": event_summary,
+            "id": _ooo_event_id(self.event_summary, start_date, adjusted_end_date),
+            "summary": self.event_summary,
             "description": "Out of Office",
             "start": {
                 "date": start_date,
-                "timeZone": timezone,
+                "timeZone": self.timezone,
             },
             "end": {
                 "date": adjusted_end_date,
-                "timeZone": timezone,
+                "timeZone": self.timezone,
             },
             "transparency": "opaque",
             "visibility": "default",
@@ -197,107 +457,154 @@ class GoogleCalendarManager:
             "eventType": "default",
         }
 
-        calendar_id = self.get_calendar_id_by_name(team_calendar_name)
-        if not calendar_id:
-            console.print(
-                f"[red]Error:[/red] Calendar '{team_calendar_name}' not found."
-            )
-            return
-
         try:
-            created_event = (
-                self.service.events()
-                .insert(calendarId=calendar_id, body=event)
-                .execute()
-            )
-            console.print(
-                f"[cyan]OutOfOffice event created (Id: {created_event['id']} from[/cyan] [yellow]{start_date}[/yellow] [cyan]to[/cyan] [yellow]{end_date}[/yellow][cyan] on calendar [/cyan][blue] {team_calendar_name}[/blue]"
+            try:
+                calendar_id, created_event = self._call_on_calendar(
+                    self.team_calendar_name,
+                    calendar_id,
+                    lambda cid: (
+                        self.service.events()
+                        .insert(calendarId=cid, body=event, fields="id")
+                        .execute()
+                    ),
+                )
+            except HttpError as error:
+                # 409: an event with this ID exists, either live or deleted earlier
+                if error.resp.status != 409:
+                    raise
+                calendar_id = self.get_calendar_id_by_name(self.team_calendar_name)
+                created_event = self._restore_cancelled_event(calendar_id, event)
+                if created_event is None:
+                    _console().print(
+                        f"[yellow]Warning: OOO event for {start_date} to {end_date} already exists on the team calendar - {self.team_calendar_name}.  Skipping action.[/yellow]"
+                    )
+                    return
+            _console().print(
+                f"[cyan]OutOfOffice event created (Id: {created_event['id']} from[/cyan] [yellow]{start_date}[/yellow] [cyan]to[/cyan] [yellow]{end_date}[/yellow][cyan] on calendar [/cyan][blue] {self.team_calendar_name}[/blue]"
             )
         except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
+            _console().print(f"[red]Error:[/red] {e}")
 
-    def event_exists(self, calendar_id, start_date, end_date, event_summary):
+    def _restore_cancelled_event(self, calendar_id, event):
         """
-        Check if an "Out of Office" event already exists for the given date range.
+        Restore a deleted event whose ID is being inserted again.
+
+        The Calendar API keeps the ID of a deleted event reserved, so inserting it
+        again fails with 409 Conflict. Such an event is brought back by updating it.
 
         Parameters:
-            calendar_id (str): The ID of the calendar to check.
-            start_date (str): The start date in 'YYYY-MM-DD' format.
-            end_date (str): The end date in 'YYYY-MM-DD' format.
-            event_summary (str): The summary text to search for in events.
+            calendar_id (str): The ID of the calendar holding the event.
+            event (dict): The event body, including its 'id'.
 
         Returns:
-            bool: True if an event with the specified summary exists within
-                the date range, False otherwise.
-
-        Notes:
-            - The method searches for events that exactly match the provided event_summary.
-            - The search is case-sensitive.
+            dict or None: The restored event, or None if the existing event is not
+                cancelled (it is a live duplicate).
         """
-        existing_events = (
+        existing_event = (
             self.service.events()
-            .list(
-                calendarId=calendar_id,
-                timeMin=start_date + "T00:00:00Z",
-                timeMax=end_date + "T00:00:00Z",
-                q=event_summary,  # Search for OOO events
-            )
+            .get(calendarId=calendar_id, eventId=event["id"], fields="status")
             .execute()
-            .get("items", [])
         )
+        if existing_event.get("status") != "cancelled":
+            return None
 
-        return any(event.get("summary") == event_summary for event in existing_events)
+        return (
+            self.service.events()
+            .update(calendarId=calendar_id, eventId=event["id"], body=event, fields="id")
+            .execute()
+        )
 
     def is_ooo_today(self, team_member=None):
         """
-        Check if the user or a specified team member is marked "Out of Office" today.
+        Check if the user or the specified team members are marked "Out of Office" today.
 
         Parameters:
-            team_member (str, optional): The username of the team member to check.
-                If None, checks the default user. Defaults to None.
+            team_member (str or list of str, optional): The username, or usernames, of
+                the team members to check. If None, checks the default user. Defaults
+                to None.
 
         Returns:
             None
 
         Notes:
-            - The method prints to the console whether the user/team member is out of office.
+            - The method prints to the console whether each user/team member is out of office.
+            - A user is out of office when one of today's events has the summary
+              '<username> <ooo_pattern>' exactly, as created by enable_out_of_office.
+            - A single user is checked with a small search for their own summary.
+              Several team members are checked with one request for today's events
+              matching 'ooo_pattern', and each member is looked up in the set of their
+              summaries.
+            - Only events overlapping today are requested, so the API does the date
+              filtering.
             - The method considers weekends as automatic "Out of Office" days and prints a
-              message to the console if today is a weekend.
+              message to the console if today is a weekend, without querying the calendar.
             - The method uses configurations like 'default_team_calendar',
-              'default_personal_calendar', and 'ooo_pattern' from a configuration method
-              (get_default_config).
+              'default_personal_calendar', and 'ooo_pattern' as read once
+              by __init__.
         """
-        team_calendar_name = get_default_config("default_team_calendar")
-        team_events = self.get_upcoming_ooo_events(team_calendar_name, max_results=100)
-
-        if team_member:
-            username = team_member
+        if isinstance(team_member, str):
+            usernames = [team_member]
+        elif team_member:
+            usernames = list(team_member)
         else:
-            username = get_default_config("default_personal_calendar").split("@")[0]
+            usernames = [self.username]
 
-        ooo_pattern = get_default_config("ooo_pattern").strip()
-        event_summary = f"{username} {ooo_pattern}"
         today = datetime.now().date()
 
-        # Check if today is a weekend
-        if today.weekday() == 5 or today.weekday() == 6:
-            console.print(
-                f"[green]User {username} is Out of Office today due to the weekend.[/green]"
-            )
+        # Check if today is a weekend before making any API request
+        if today.weekday() >= 5:
+            for username in usernames:
+                _console().print(
+                    f"[green]User {username} is Out of Office today due to the weekend.[/green]"
+                )
             return
 
-        for event in team_events:
-            if event_summary in event.get("summary", ""):
-                start = self.get_date_from_event(event, "start")
-                end = self.get_date_from_event(event, "end")
+        calendar_id = self.get_calendar_id_by_name(self.team_calendar_name)
+        if not calendar_id:
+            return
 
-                if start <= today <= end:
-                    console.print(
-                        f"[green]User {username} is Out of Office today.[/green]"
-                    )
-                    return
+        from googleapiclient.errors import HttpError
+
+        try:
+            if len(usernames) == 1:
+                # A single user only needs their own few events of the day
+                event_summary = f"{usernames[0]} {self.ooo_pattern}"
+                _, response = self._call_on_calendar(
+                    self.team_calendar_name,
+                    calendar_id,
+                    lambda cid: self._ooo_on_day_request(cid, event_summary, today).execute(),
+                )
+                # q= is a full-text search, so confirm the summary on the few hits
+                todays_events = response.get("items", [])
+                if any(event.get("summary") == event_summary for event in todays_events):
+                    ooo_usernames = set(usernames)
+                else:
+                    ooo_usernames = set()
+            else:
+                _, todays_summaries = self._call_on_calendar(
+                    self.team_calendar_name,
+                    calendar_id,
+                    lambda cid: self._ooo_summaries_on_day(cid, today),
+                )
+                ooo_usernames = {
+                    username
+                    for username in usernames
+                    if f"{username} {self.ooo_pattern}" in todays_summaries
+                }
+        except HttpError as error:
+            _console().print(f"[red]An error occurred:[/red] {error}")
+            return
+        except Exception as e:
+            _console().print(f"[red]Unexpected error:[/red] {e}")
+            return
 
-        console.print(f"[yellow]User {username} is not Out of Office today.[/yellow]")
+        for username in usernames:
+            if username in ooo_usernames:
+                _console().print(f"[green]User {username} is Out of Office today.[/green]")
+            else:
+                _console().print(
+                    f"[yellow]User {username} is not Out of Office today.[/yellow]"
+                )
 
     def check_out_of_office(self, max_results=10):
         """
@@ -315,113 +622,344 @@ class GoogleCalendarManager:
             None
 
         Notes:
-            - The method prints each event's details directly to the console.
+            - The method prints each event's details directly to the console, in a
+              single print call once all events have been read.
             - If there are no upcoming OOO events, a message is printed to the console.
-            - The method uses configurations like 'default_team_calendar' from a configuration
-              method (get_default_config).
-            - The method adjusts the end date for multi-day events to ensure accurate display.
+            - The method uses configurations like 'default_team_calendar' as read
+              once by __init__.
+            - The method adjusts the exclusive end date of all-day events to show the
+              last day off.
         """
-        team_calendar_name = get_default_config("default_team_calendar")
-        team_events = self.get_upcoming_ooo_events(team_calendar_name, max_results)
-
-        if not team_events:
-            console.print("[yellow]No upcoming OOO events found.[/yellow]")
-            return
+        team_events = self.get_upcoming_ooo_events(self.team_calendar_name, max_results)
+        calendar_markup = f"on [/green] [blue]{self.team_calendar_name}[/blue]"
 
+        lines = []
         for event in team_events:
-            start = self.get_date_from_event(event, "start")
-            end = self.get_date_from_event(event, "end")
+            start, end = self.get_dates_from_event(event, inclusive_end=True)
+            # q= also matches descriptions, so an untitled event can come back
             summary = event.get("summary", "")
-            event_id = event.get("id", "")
-            event_type = event.get("eventType", "")
-
-            # Adjust the end date for multi-day events
-            if start != end:
-                adjusted_end_date = end - timedelta(days=1)
-            else:
-                adjusted_end_date = end
-
-            start_str = start.strftime("%Y-%m-%d")
-            end_str = adjusted_end_date.strftime("%Y-%m-%d")
-
-            console.print(
-                f"☀️ 🏖️ 🌴 [green]{start_str} to {end_str} - {summary} (Event ID: {event_id}, Type: {event_type}) on [/green] [blue]{team_calendar_name}[/blue]"
+            lines.append(
+                f"☀️ 🏖️ 🌴 [green]{start.isoformat()} to {end.isoformat()} - {summary} "
+                f"(Event ID: {event['id']}, Type: {event.get('eventType', '')}) {calendar_markup}"
             )
 
+        if lines:
+            _console().print("\n".join(lines))
+        else:
+            _console().print("[yellow]No upcoming OOO events found.[/yellow]")
+
     def get_upcoming_ooo_events(self, team_calendar_name, max_results=100):
         """
         Fetch upcoming "Out of Office" events for a specified calendar within the next month.
 
         This method retrieves OOO events from the specified team calendar that occur
         from today until the last day of the next month. It uses the Google Calendar API
-        to fetch events and returns them as a list of event objects.
+        to fetch events page by page and yields them as event objects. While the caller
+        processes one page, the next one is fetched on the worker pool.
+
+        With 'incremental_sync' enabled, the events come from a local copy of the
+        calendar that is brought up to date with the changes since the last run
+        instead (see _sync_events).
 
         Parameters:
             team_calendar_name (str): The name of the team calendar to fetch events from.
-            max_results (int, optional): The maximum number of events to retrieve.
-                Defaults to 100.
-
-        Returns:
-            list: A list of upcoming OOO event objects. Each object contains details
-                about an event, such as its summary, start time, and end time. Returns
-                an empty list if no events are found or an error occurs.
+            max_results (int, optional): The maximum number of events to retrieve, or None
+                for all of them. Defaults to 100.
 
-        Raises:
-            HttpError: If an HTTP error occurs while fetching events from the API.
-            Exception: If an unexpected error occurs.
+        Yields:
+            dict: Upcoming OOO event objects. Each object contains details about an
+                event, such as its summary, start time, and end time. Nothing is
+                yielded if no events are found or an error occurs.
 
         Notes:
             - The method uses configurations like 'default_personal_calendar' and 'ooo_pattern'
-              from a configuration method (get_default_config).
+              as read once by __init__.
             - The method prints error messages directly to the console if the calendar is not
               found or if an error occurs while fetching events.
             - The method constructs a query to fetch events that match a specific summary pattern.
         """
+        from googleapiclient.errors import HttpError
+
         calendar_id = self.get_calendar_id_by_name(team_calendar_name)
         if not calendar_id:
-            console.print(
+            _console().print(
                 f"[red]Error:[/red] Calendar '{team_calendar_name}' not found."
             )
-            return []
-
-        today = dt.datetime.utcnow().date()
-        first_day_next_month = (today.replace(day=1) + dt.timedelta(days=32)).replace(
-            day=1
-        )
-        last_day_next_month = (first_day_next_month + dt.timedelta(days=32)).replace(
-            day=1
-        ) - dt.timedelta(days=1)
-
-        start_date_str = f"{today}T00:00:00Z"
-        end_date_str = f"{last_day_next_month}T23:59:59Z"
+            return
 
-        username = get_default_config("default_personal_calendar").split("@")[0]
-        ooo_pattern = get_default_config("ooo_pattern").strip()
-        event_summary = f"{username} {ooo_pattern}"
+        # Fixed once so that every page is requested with the same window
+        window = _upcoming_window()
+        remaining = max_results
+        page_size = min(max_results, MAX_PAGE_SIZE) if max_results else MAX_PAGE_SIZE
 
         try:
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=start_date_str,
-                    timeMax=end_date_str,
-                    maxResults=max_results,
-                    singleEvents=True,
-                    orderBy="startTime",
-                    q=event_summary,
+            if self.incremental_sync:
+                calendar_id, events = self._call_on_calendar(
+                    team_calendar_name, calendar_id, self._sync_events
                 )
-                .execute()
+                upcoming = self._upcoming_from_synced(calendar_id, events, window)
+                yield from upcoming[:max_results] if max_results else upcoming
+                return
+
+            calendar_id, events_result = self._call_on_calendar(
+                team_calendar_name,
+                calendar_id,
+                lambda cid: self._upcoming_ooo_request(cid, window, page_size).execute(),
             )
-            events = events_result.get("items", [])
-            return events
+            while True:
+                events = events_result.get("items", [])
+                if remaining is not None:
+                    events = events[:remaining]
+                    remaining -= len(events)
+
+                # Prefetch the next page while the caller works through this one
+                next_page = None
+                page_token = events_result.get("nextPageToken")
+                if page_token and remaining != 0:
+                    next_page = self._submit(
+                        self._upcoming_ooo_request(calendar_id, window, page_size, page_token)
+                    )
+
+                yield from events
+
+                if next_page is None:
+                    return
+                events_result = next_page.result()
 
         except HttpError as error:
-            console.print(f"[red]An error occurred:[/red] {error}")
-            return []
+            _console().print(f"[red]An error occurred:[/red] {error}")
         except Exception as e:
-            console.print(f"[red]Unexpected error:[/red] {e}")
-            return []
+            _console().print(f"[red]Unexpected error:[/red] {e}")
+
+    def _sync_events(self, calendar_id):
+        """
+        Bring the local copy of a calendar up to date and return its events.
+
+        The copy is stored under SYNC_DIR together with the sync token of the last
+        run. Only the changes since that token are requested; the first run, or a
+        run after the token expired (410 Gone), downloads the whole calendar once.
+        The copy is only rewritten when the sync brought changes.
+
+        Parameters:
+            calendar_id (str): The ID of the calendar to sync.
+
+        Returns:
+            dict: All non-deleted events of the calendar, keyed by event ID.
+                Recurring events are stored once, as their master event.
+
+        Raises:
+            HttpError: If an HTTP error other than 410 occurs while syncing.
+        """
+        from googleapiclient.errors import HttpError
+
+        path = _sync_state_path(calendar_id)
+        state = _load_sync_state(path)
+        try:
+            changed = self._pull_event_changes(calendar_id, state)
+        except HttpError as error:
+            if error.resp.status != 410 or state["sync_token"] is None:
+                raise
+            # The sync token expired; start over with a full sync
+            state = {"sync_token": None, "events": {}}
+            changed = self._pull_event_changes(calendar_id, state)
+
+        if changed:
+            _save_sync_state(path, state)
+        return state["events"]
+
+    def _pull_event_changes(self, calendar_id, state):
+        """
+        Apply the event changes since state['sync_token'] to state, page by page.
+
+        Parameters:
+            calendar_id (str): The ID of the calendar to sync.
+            state (dict): The sync state, as returned by _load_sync_state. Updated
+                in place, including its new sync token.
+
+        Returns:
+            bool: True if any event changed or the sync token moved on.
+        """
+        events = state["events"]
+        previous_token = state["sync_token"]
+        changed = False
+        request = self.service.events().list(
+            calendarId=calendar_id,
+            syncToken=state["sync_token"],
+            fields=SYNC_EVENT_FIELDS,
+        )
+        while request is not None:
+            response = request.execute()
+            for event in response.get("items", []):
+                changed = True
+                if event.get("status") == "cancelled":
+                    events.pop(event["id"], None)
+                else:
+                    events[event["id"]] = event
+            if "nextSyncToken" in response:
+                state["sync_token"] = response["nextSyncToken"]
+            request = self.service.events().list_next(request, response)
+        return changed or state["sync_token"] != previous_token
+
+    def _upcoming_from_synced(self, calendar_id, events, window):
+        """
+        Select the user's upcoming OOO events from a synced calendar.
+
+        Parameters:
+            calendar_id (str): The ID of the synced calendar.
+            events (dict): The events returned by _sync_events.
+            window (tuple): The (timeMin, timeMax) strings, as returned by
+                _upcoming_window.
+
+        Returns:
+            list: The matching events overlapping the window, sorted by start date.
+                Recurring events are expanded into their instances in the window;
+                the instance requests run concurrently on the worker pool. Each event
+                or instance, modified ones included, is matched on its own summary.
+        """
+        first_day = date.fromisoformat(window[0][:10])
+        last_day = date.fromisoformat(window[1][:10])
+
+        def is_upcoming_ooo(event):
+            if self.event_summary not in event.get("summary", ""):
+                return False
+            start, end = self.get_dates_from_event(event, inclusive_end=True)
+            return start <= last_day and end >= first_day
+
+        # Masters expanded below; their modified instances come back from instances()
+        expanded = {
+            event_id
+            for event_id, event in events.items()
+            if "recurrence" in event and self.event_summary in event.get("summary", "")
+        }
+        instance_lists = [
+            self._executor.submit(self._recurring_instances, calendar_id, event_id, window)
+            for event_id in expanded
+        ]
+
+        upcoming = [
+            event
+            for event in events.values()
+            if "recurrence" not in event
+            and event.get("recurringEventId") not in expanded
+            and is_upcoming_ooo(event)
+        ]
+        for future in instance_lists:
+            upcoming.extend(event for event in future.result() if is_upcoming_ooo(event))
+
+        upcoming.sort(key=self.get_dates_from_event)
+        return upcoming
+
+    def _recurring_instances(self, calendar_id, event_id, window):
+        """
+        Fetch all instances of a recurring event within a time window, page by page.
+
+        Runs on the worker pool, over the worker thread's own transport.
+
+        Parameters:
+            calendar_id (str): The ID of the calendar holding the event.
+            event_id (str): The ID of the recurring (master) event.
+            window (tuple): The (timeMin, timeMax) strings, as returned by
+                _upcoming_window.
+
+        Returns:
+            list: The instances, including modified ones with their own summary.
+        """
+        time_min, time_max = window
+        instances = []
+        request = self.service.events().instances(
+            calendarId=calendar_id,
+            eventId=event_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            maxResults=MAX_PAGE_SIZE,
+            fields=EVENT_FIELDS,
+        )
+        while request is not None:
+            response = self._execute_in_worker(request)
+            instances.extend(response.get("items", []))
+            request = self.service.events().instances_next(request, response)
+        return instances
+
+    def _upcoming_ooo_request(self, calendar_id, window, max_results, page_token=None):
+        """
+        Build the events.list request for the user's OOO events within a time window.
+
+        Parameters:
+            calendar_id (str): The ID of the calendar to fetch events from.
+            window (tuple): The (timeMin, timeMax) strings, as returned by
+                _upcoming_window.
+            max_results (int): The maximum number of events to retrieve per page.
+            page_token (str, optional): The nextPageToken of the previous page.
+                Defaults to None, for the first page.
+
+        Returns:
+            googleapiclient.http.HttpRequest: The request, not yet executed.
+        """
+        time_min, time_max = window
+        return self.service.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            maxResults=max_results,
+            singleEvents=True,
+            orderBy="startTime",
+            q=self.event_summary,
+            pageToken=page_token,
+            fields=EVENT_FIELDS,
+        )
+
+    def _ooo_on_day_request(self, calendar_id, event_summary, day):
+        """
+        Build the events.list request for one user's OOO events on a single local day.
+
+        Parameters:
+            calendar_id (str): The ID of the calendar to fetch events from.
+            event_summary (str): The summary text to search for in events.
+            day (datetime.date): The day to check, in the local timezone.
+
+        Returns:
+            googleapiclient.http.HttpRequest: The request, not yet executed.
+        """
+        time_min, time_max = _local_day_bounds(day)
+        return self.service.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            q=event_summary,
+            maxResults=5,
+            fields="items(summary)",
+        )
+
+    def _ooo_summaries_on_day(self, calendar_id, day):
+        """
+        Collect the summaries of all OOO events overlapping a single local day.
+
+        Parameters:
+            calendar_id (str): The ID of the calendar to fetch events from.
+            day (datetime.date): The day to check, in the local timezone.
+
+        Returns:
+            set: The summaries of the events matching 'ooo_pattern' on that day.
+        """
+        time_min, time_max = _local_day_bounds(day)
+        summaries = set()
+        request = self.service.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            q=self.ooo_pattern,
+            maxResults=MAX_PAGE_SIZE,
+            fields="nextPageToken,items(summary)",
+        )
+        while request is not None:
+            response = request.execute()
+            summaries.update(
+                event["summary"] for event in response.get("items", []) if "summary" in event
+            )
+            request = self.service.events().list_next(request, response)
+        return summaries
 
     def get_date_from_event(self, event, time_key):
         """
@@ -443,37 +981,61 @@ class GoogleCalendarManager:
         Notes:
             - The method expects the event object to contain valid time information under
               the specified time_key.
-            - The method handles two formats of time information:
-                1. 'dateTime': A string in ISO 8601 format, which includes specific time and
-                   optionally timezone information.
-                2. 'date': A string in 'YYYY-MM-DD' format, representing a full day without
+            - The method handles two formats of time information, checked in this order:
+                1. 'date': A string in 'YYYY-MM-DD' format, representing a full day without
                    specific time.
+                2. 'dateTime': A string in ISO 8601 format, which includes specific time and
+                   optionally timezone information.
             - If 'dateTime' is provided and includes timezone information, the method converts
-              the date to the local timezone before returning it.
+              the date to the local timezone before returning it. Timezone lookups are
+              cached, so each zone is resolved once per process.
         """
         time_info = event[time_key]
-        if "dateTime" in time_info:
-            local_tz = tz.gettz(event[time_key]["timeZone"])
-            return (
-                dt.datetime.fromisoformat(time_info["dateTime"])
-                .astimezone(local_tz)
-                .date()
-            )
+        # All-day events, like the ones enable_out_of_office creates, are the common case
         if "date" in time_info:
-            return dt.datetime.strptime(time_info["date"], "%Y-%m-%d").date()
+            return date.fromisoformat(time_info["date"])
+        if "dateTime" in time_info:
+            # Without a timeZone, gettz(None) falls back to the local timezone
+            local_tz = _gettz(time_info.get("timeZone"))
+            # fromisoformat only accepts a trailing 'Z' from Python 3.11 on
+            date_time = time_info["dateTime"].replace("Z", "+00:00")
+            return datetime.fromisoformat(date_time).astimezone(local_tz).date()
 
-    def get_calendar_id_by_name(self, team_calendar_name):
+    def get_dates_from_event(self, event, inclusive_end=False):
+        """
+        Extract both the start and end dates of an event.
+
+        Parameters:
+            event (dict): The event object containing details about a Google Calendar event.
+            inclusive_end (bool, optional): If True, return the last day of an all-day
+                event instead of its exclusive end date. Defaults to False.
+
+        Returns:
+            tuple: The (start, end) datetime.date pair, as returned by get_date_from_event.
+        """
+        start = self.get_date_from_event(event, "start")
+        end = self.get_date_from_event(event, "end")
+        if inclusive_end and "date" in event["end"]:
+            # All-day events end on the (exclusive) following day
+            end -= timedelta(days=1)
+        return start, end
+
+    def get_calendar_id_by_name(self, team_calendar_name, guess=True):
         """
         Retrieve the calendar ID based on its name.
 
         This method attempts to retrieve the ID of a Google Calendar given its name.
-        Initially, it tries to get the calendar directly using the provided name as an ID.
-        If this fails (e.g., due to an invalid ID or lack of permissions), it iterates
-        through all available calendars in the calendar list to find a calendar with a
-        matching name.
+        If the name already looks like a calendar ID (an email address), it is used
+        as-is without an API request; callers re-resolve it through
+        _reresolve_calendar_id if the API later rejects it. When not guessing, an
+        ID-like name is first checked by getting the calendar directly. Any other
+        name, or an ID that fails (e.g., due to an invalid ID or lack of permissions),
+        is looked up by summary in the user's calendar list.
 
         Parameters:
             team_calendar_name (str): The name of the team calendar to retrieve the ID for.
+            guess (bool, optional): Whether an ID-like name may be used without asking
+                the API. Defaults to True.
 
         Returns:
             str or None: The ID of the calendar if found; otherwise, None.
@@ -481,29 +1043,122 @@ class GoogleCalendarManager:
         Notes:
             - The method prints error messages directly to the console if the calendar is not
               found or if an error occurs while fetching calendar data.
-            - Two attempts are made to retrieve the calendar ID:
-                1. Direct retrieval using the name as an ID.
-                2. Searching through all available calendars.
+            - Up to two attempts are made to retrieve the calendar ID:
+                1. Direct retrieval using the name as an ID, for ID-like names only.
+                2. Searching through all available calendars. The calendar list is
+                   fetched once and kept as a {summary: id} dict.
             - If both attempts fail, the method returns None and prints an error message.
+            - Resolved IDs are memoized for the lifetime of the instance, so only the
+              first lookup of a given name hits the API.
         """
-        try:
-            calendar = (
-                self.service.calendars().get(calendarId=team_calendar_name).execute()
-            )
-            if calendar:
-                return calendar["id"]
-        except Exception:
+        if team_calendar_name in self._calendar_ids:
+            return self._calendar_ids[team_calendar_name]
+
+        if guess and _looks_like_calendar_id(team_calendar_name):
+            self._calendar_ids[team_calendar_name] = team_calendar_name
+            self._guessed_calendar_ids.add(team_calendar_name)
+            return team_calendar_name
+
+        # A human-readable name is never a valid ID, so skip the round-trip
+        if _looks_like_calendar_id(team_calendar_name):
             try:
-                calendar_list = self.service.calendarList().list().execute()
+                calendar = (
+                    self.service.calendars()
+                    .get(calendarId=team_calendar_name, fields="id")
+                    .execute()
+                )
+                if calendar:
+                    self._calendar_ids[team_calendar_name] = calendar["id"]
+                    return calendar["id"]
+            except Exception:
+                pass
+
+        calendar_id = self._get_calendar_ids_by_summary().get(team_calendar_name)
+        if calendar_id:
+            self._calendar_ids[team_calendar_name] = calendar_id
+            return calendar_id
+
+        _console().print(f"[red]Error:[/red] Calendar '{team_calendar_name}' not found.")
+        return None
 
-                for calendar in calendar_list["items"]:
-                    if calendar["summary"] == team_calendar_name:
-                        return calendar["id"]
+    def _get_calendar_ids_by_summary(self):
+        """
+        Return the user's calendar list as a {summary: id} dict, fetching it once.
+
+        Returns:
+            dict: Calendar IDs keyed by calendar summary. If several calendars share a
+                summary, the first one listed wins. Empty if the list cannot be fetched;
+                the error is printed and the fetch is retried on the next call.
+        """
+        if self._calendar_ids_by_summary is None:
+            calendar_ids_by_summary = {}
+            try:
+                request = self.service.calendarList().list(
+                    fields="nextPageToken,items(id,summary)"
+                )
+                while request is not None:
+                    response = request.execute()
+                    for calendar in response.get("items", []):
+                        calendar_ids_by_summary.setdefault(
+                            calendar.get("summary"), calendar["id"]
+                        )
+                    request = self.service.calendarList().list_next(request, response)
             except Exception as e2:
-                console.print(f"[red]Error:[/red] {e2}")
+                _console().print(f"[red]Error:[/red] {e2}")
+                return {}
+            self._calendar_ids_by_summary = calendar_ids_by_summary
+        return self._calendar_ids_by_summary
 
-        console.print(f"[red]Error:[/red] Calendar '{team_calendar_name}' not found.")
-        return None
+    def _reresolve_calendar_id(self, team_calendar_name, calendar_id, error):
+        """
+        Resolve a calendar name through the API after a guessed ID was rejected.
+
+        Parameters:
+            team_calendar_name (str): The name of the team calendar.
+            calendar_id (str): The calendar ID the failed request was made with.
+            error (googleapiclient.errors.HttpError): The error raised by that request.
+
+        Returns:
+            str or None: A different calendar ID to retry with, or None if the error
+                was not caused by a guessed ID.
+        """
+        if error.resp.status != 404:
+            return None
+
+        if self._calendar_ids.get(team_calendar_name) == calendar_id:
+            if team_calendar_name not in self._guessed_calendar_ids:
+                return None
+            self._guessed_calendar_ids.discard(team_calendar_name)
+            del self._calendar_ids[team_calendar_name]
+
+        # Either resolves the name now, or returns the ID an earlier retry found
+        retry_id = self.get_calendar_id_by_name(team_calendar_name, guess=False)
+        return retry_id if retry_id != calendar_id else None
+
+    def _call_on_calendar(self, team_calendar_name, calendar_id, call):
+        """
+        Run an API call against a calendar, re-resolving a guessed ID once on 404.
+
+        Parameters:
+            team_calendar_name (str): The name of the team calendar.
+            calendar_id (str): The calendar ID returned by get_calendar_id_by_name.
+            call (callable): Function taking a calendar ID and performing the request.
+
+        Returns:
+            tuple: The calendar ID actually used and the result of call.
+
+        Raises:
+            HttpError: If the request fails for any other reason.
+        """
+        from googleapiclient.errors import HttpError
+
+        try:
+            return calendar_id, call(calendar_id)
+        except HttpError as error:
+            retry_id = self._reresolve_calendar_id(team_calendar_name, calendar_id, error)
+            if not retry_id:
+                raise
+            return retry_id, call(retry_id)
 
     def disable_out_of_office(self):
         """
@@ -511,9 +1166,12 @@ class GoogleCalendarManager:
 
         This method attempts to find and delete OOO events for the user on the team
         calendar. It retrieves the user's upcoming OOO events and deletes any event
-        that matches the specified summary pattern. If an event is successfully deleted,
-        a success message is printed to the console. If no matching events are found,
-        a different message is printed.
+        that matches the specified summary pattern. The deletions are sent as batch
+        requests, so a single HTTP round-trip covers up to BATCH_LIMIT events. Each
+        batch is sent as soon as it is full, while the following events are still being
+        listed. Once all batches have run, a single summary of the deleted events and
+        any errors is printed to the console. If no matching events are found, a
+        different message is printed.
 
         Parameters:
             None
@@ -523,40 +1181,107 @@ class GoogleCalendarManager:
 
         Notes:
             - The method uses configurations like 'default_team_calendar',
-              'default_personal_calendar', and 'ooo_pattern' from a configuration
-              method (get_default_config).
+              'default_personal_calendar', and 'ooo_pattern' as read
+              once by __init__.
             - The method prints messages directly to the console to inform about the success
               or failure of the operation.
-            - If an error occurs while deleting an event, an error message is printed, and
-              the method returns early.
+            - If an error occurs while deleting an event, or a whole batch request fails,
+              the remaining deletions still go through; the errors are listed after the
+              summary.
             - If no events are found, a message is printed, and the method completes normally.
         """
-        team_calendar_name = get_default_config("default_team_calendar")
-        username = get_default_config("default_personal_calendar").split("@")[0]
-        ooo_pattern = get_default_config("ooo_pattern").strip()
-        event_summary = f"{username} {ooo_pattern}"
-        calendar_id = self.get_calendar_id_by_name(team_calendar_name)
+        deleted = []
+        errors = []
 
-        # Search for the event
-        events = self.get_upcoming_ooo_events(team_calendar_name)
-        for event in events:
-            if event.get("summary") == event_summary:
-                try:
-                    self.service.events().delete(
-                        calendarId=calendar_id, eventId=event["id"]
-                    ).execute()
-                    console.print(
-                        f"[green]Successfully disabled Out of Office for {username} on {team_calendar_name}.[/green]"
-                    )
-                except Exception as e:
-                    console.print(f"[red]Error:[/red] {e}")
-                    return
+        def on_delete(request_id, response, exception):
+            if exception is not None:
+                errors.append(exception)
+            else:
+                deleted.append(request_id)
+
+        def send(batch):
+            # A failed batch must not hide the summary of the ones already sent
+            try:
+                batch.execute()
+            except Exception as e:
+                errors.append(e)
+
+        found = 0
+        calendar_id = None
+        batch = None
+        # The events arrive page by page, so a full batch is sent while the next
+        # page is still being fetched
+        for event in self.get_upcoming_ooo_events(self.team_calendar_name, max_results=None):
+            if event.get("summary") != self.event_summary:
+                continue
+            if batch is None:
+                # Resolved (and possibly corrected) while listing the first page
+                calendar_id = calendar_id or self.get_calendar_id_by_name(
+                    self.team_calendar_name
+                )
+                batch = self.service.new_batch_http_request(callback=on_delete)
+            batch.add(
+                self.service.events().delete(calendarId=calendar_id, eventId=event["id"])
+            )
+            found += 1
+            if found % BATCH_LIMIT == 0:
+                send(batch)
+                batch = None
+        if batch is not None:
+            send(batch)
+
+        if not found:
+            _console().print(
+                f"[yellow]No Out of Office event found for {self.username} \
+                on {self.team_calendar_name}.[/yellow]"
+            )
+            return
 
-        if not events:
-            console.print(
-                f"[yellow]No Out of Office event found for {username} \
-                on {team_calendar_name}.[/yellow]"
+        if deleted:
+            _console().print(
+                f"[green]Successfully disabled Out of Office for {self.username} on {self.team_calendar_name} ({len(deleted)} event(s) deleted).[/green]"
             )
+        for error in errors:
+            _console().print(f"[red]Error:[/red] {error}")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config():
+    """
+    Parse the 'DEFAULT' section of config.ini once and return it as a dict.
+
+    Only the subset of the INI format used by config.ini is supported: 'key = value'
+    or 'key: value' lines, '#' and ';' comment lines, and section headers. Keys are
+    lower-cased, as configparser does. Keys outside the 'DEFAULT' section are ignored.
+
+    Returns:
+        dict: The 'DEFAULT' section values keyed by option name. Empty if the file
+            does not exist.
+    """
+    config = {}
+    in_default = True
+    try:
+        with open("config.ini", encoding="utf-8") as config_file:
+            for line in config_file:
+                line = line.strip()
+                if not line or line.startswith(("#", ";")):
+                    continue
+                if line.startswith("["):
+                    in_default = line == "[DEFAULT]"
+                    continue
+                if not in_default:
+                    continue
+                separator = min(
+                    (i for i in (line.find("="), line.find(":")) if i != -1),
+                    default=-1,
+                )
+                if separator == -1:
+                    continue
+                key, value = line[:separator], line[separator + 1 :]
+                config[key.strip().lower()] = value.strip()
+    except FileNotFoundError:
+        pass
+    return config
 
 
 def get_default_config(key):
@@ -575,17 +1300,14 @@ def get_default_config(key):
             section of the configuration file. If the key is not found, returns None.
 
     Notes:
-        - The function uses the configparser module to parse the 'config.ini' file.
-        - The function does not handle exceptions that might be raised by configparser
-          (e.g., if the file does not exist or is not properly formatted). Ensure that
-          the 'config.ini' file is available and correctly formatted in the same directory
-          as the script.
+        - The 'config.ini' file is parsed once per process by _load_config; later
+          calls are served from memory.
+        - A missing 'config.ini' yields None for every key. Ensure that the 'config.ini'
+          file is available and correctly formatted in the same directory as the script.
         - If the key is not found in the 'DEFAULT' section, the function returns None
           without raising an error.
     """
-    config = configparser.ConfigParser()
-    config.read("config.ini")
-    return config["DEFAULT"].get(key, None)
+    return _load_config().get(key, None)
 
 
 def main():
@@ -600,7 +1322,8 @@ def main():
     Supported Command-Line Arguments:
         --check-outofoffice: Check if a team member is Out of Office.
         --is-ooo-today: Check if the user is Out of Office today.
-        --team-member [NAME]: Specify the team member's name to check their OOO status.
+        --team-member [NAME ...]: Specify one or more team member names to check their
+            OOO status.
         --enable-outofoffice: Enable Out of Office for the specified dates.
         --start-date [YYYY-MM-DD]: Specify the start date for the OOO event.
         --end-date [YYYY-MM-DD]: Specify the end date for the OOO event.
@@ -611,7 +1334,9 @@ def main():
           appropriate action to take.
         - If no arguments are provided, the function prints the help message and exits.
         - The function creates an instance of GoogleCalendarManager to interact with
-          Google Calendar and perform the requested operations.
+          Google Calendar and perform the requested operations. It is only created once
+          the arguments are parsed and a command was requested, so '--help' and argument
+          errors neither authenticate nor import the Google client libraries.
         - Error messages are printed to the console if required arguments for an operation
           are missing.
     """
@@ -627,12 +1352,9 @@ def main():
     User jclaretm is not Out of Office today.
     
     $ oooasis.py --disable-outofoffice
-    Successfully disabled Out of Office for jclaretm on rh-eng-telco5g-integration.
+    Successfully disabled Out of Office for jclaretm on rh-eng-telco5g-integration (1 event(s) deleted).
     '''
 
-    # Initialize console object from the rich library
-    console = Console()
-    
     parser = argparse.ArgumentParser(
         description="Google Calendar Command Line Tool",
         epilog=example_text,  # Add example_text to epilog to display it in help message
@@ -652,7 +1374,8 @@ def main():
     parser.add_argument(
         "--team-member",
         type=str,
-        help="Specify the team member's name to check their OOO status",
+        nargs="+",
+        help="Specify one or more team member names to check their OOO status",
     )
     parser.add_argument(
         "--enable-outofoffice",
@@ -673,15 +1396,29 @@ def main():
         "--disable-outofoffice", action="store_true", help="Disable Out of Office"
     )
 
-    args = parser.parse_args()
-
-   # Instantiate GoogleCalendarManager
-    calendar = GoogleCalendarManager()
-
     if len(sys.argv) == 1:
         parser.print_help(sys.stderr)
         sys.exit(1)
 
+    args = parser.parse_args()
+
+    if args.enable_outofoffice and not (args.start_date and args.end_date):
+        _console().print(
+            "[red]Please specify both --start-date and --end-date for the OOO event.[/red]"
+        )
+        args.enable_outofoffice = False
+
+    if not (
+        args.check_outofoffice
+        or args.disable_outofoffice
+        or args.is_ooo_today
+        or args.enable_outofoffice
+    ):
+        return
+
+    # Instantiate GoogleCalendarManager, which authenticates, only when a command needs it
+    calendar = GoogleCalendarManager()
+
     if args.check_outofoffice:
         calendar.check_out_of_office()
 
@@ -692,12 +1429,7 @@ def main():
         calendar.is_ooo_today(args.team_member)
 
     if args.enable_outofoffice:
-        if args.start_date and args.end_date:
-            calendar.enable_out_of_office(args.start_date, args.end_date)
-        else:
-            console.print(
-                "[red]Please specify both --start-date and --end-date for the OOO event.[/red]"
-            )
+        calendar.enable_out_of_office(args.start_date, args.end_date)
 
 
 if __name__ == "__main__":